@@ -3,6 +3,7 @@ from typing import Optional
 
 from simpy import Environment, Process
 
+from settings import settings
 from utils.logging_utils import log, configure_logs
 
 
@@ -31,4 +32,5 @@ class Actor:
     def _log(self, msg: str):
         """Method to log detailed information of the actor's actions"""
 
-        log(env=self.env, actor_name=self.__class__.__name__, condition=self.condition, msg=msg)
+        if settings.VERBOSE_LOGS:
+            log(env=self.env, actor_name=self.__class__.__name__, condition=self.condition, msg=msg)
@@ -23,7 +23,7 @@ from policies.courier.movement_evaluation.courier_movement_evaluation_policy imp
 from policies.courier.movement_evaluation.geohash_neighbors import NeighborsMoveEvalPolicy
 from policies.courier.movement_evaluation.still import StillMoveEvalPolicy
 from settings import settings
-from utils.datetime_utils import sec_to_time, time_diff, sec_to_hour
+from utils.datetime_utils import sec_to_time, time_diff, time_to_sec, sec_to_hour
 
 COURIER_ACCEPTANCE_POLICIES_MAP = {
     'uniform': UniformAcceptancePolicy(),
@@ -39,7 +39,7 @@ COURIER_MOVEMENT_POLICIES_MAP = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Courier(Actor):
     """A class used to handle a courier's state and events"""
 
@@ -48,7 +48,11 @@ class Courier(Actor):
     movement_evaluation_policy: Optional[CourierMovementEvaluationPolicy] = NeighborsMoveEvalPolicy()
     movement_policy: Optional[CourierMovementPolicy] = OSRMMovementPolicy()
 
-    acceptance_rate: float = random.uniform(settings.COURIER_MIN_ACCEPTANCE_RATE, 1)
+    acceptance_rate: float = field(
+        default_factory=lambda: random.uniform(settings.COURIER_MIN_ACCEPTANCE_RATE, 1)
+    )
+    fleet: Optional[Any] = None
+    fleet_index: Optional[int] = None
     accepted_notifications: List[Notification] = field(default_factory=lambda: list())
     active_route: Optional[Route] = None
     active_stop: Optional[Stop] = None
@@ -69,13 +73,32 @@ class Courier(Actor):
 
         self._log(f'Actor {self.courier_id} logged on')
 
+        if self.fleet is not None:
+            self.fleet_index = self.fleet.register(self)
+
         self._schedule_log_off_event()
         self.state = self.env.process(self._idle_state())
 
+    def update_location(self, location: Location):
+        """Method to update the courier's location, keeping the world's fleet mirror in sync"""
+
+        self.location = location
+
+        if self.fleet is not None:
+            self.fleet.update_courier_location(self)
+
+    def update_condition(self, condition: str):
+        """Method to update the courier's condition, keeping the world's fleet mirror in sync"""
+
+        self.condition = condition
+
+        if self.fleet is not None:
+            self.fleet.update_courier_condition(self)
+
     def _idle_state(self):
         """State that simulates a courier being idle / waiting"""
 
-        self.condition = 'idle'
+        self.update_condition('idle')
 
         self._log(f'Courier {self.courier_id} begins idling')
 
@@ -96,8 +119,8 @@ class Courier(Actor):
     def _moving_state(self, destination: Location):
         """State detailing how a courier moves to a destination"""
 
-        self.condition = 'moving'
-        state_start = sec_to_time(self.env.now)
+        self.update_condition('moving')
+        state_start = self.env.now
         self.dispatcher.courier_moving_event(courier=self)
         yield self.env.process(
             self.movement_policy.execute(
@@ -107,16 +130,16 @@ class Courier(Actor):
                 courier=self
             )
         )
-        self.utilization_time += time_diff(sec_to_time(self.env.now), state_start)
+        self.utilization_time += self.env.now - state_start
 
     def _picking_up_state(self, orders: Dict[int, Order]):
         """State that simulates a courier picking up stuff at the pick up location"""
 
-        self.condition = 'picking_up'
+        self.update_condition('picking_up')
 
         self._log(f'Courier {self.courier_id} begins pick up state')
 
-        state_start = sec_to_time(self.env.now)
+        state_start = self.env.now
 
         try:
             self.dispatcher.courier_picking_up_event(courier=self)
@@ -126,15 +149,21 @@ class Courier(Actor):
             pass
 
         try:
-            service_time = max(order.pick_up_service_time for order in orders.values())
-            latest_ready_time = max(order.ready_time for order in orders.values())
-            waiting_time = time_diff(latest_ready_time, sec_to_time(self.env.now))
+            service_time, latest_ready_time = 0, None
+            for order in orders.values():
+                if order.pick_up_service_time > service_time:
+                    service_time = order.pick_up_service_time
+
+                if latest_ready_time is None or order.ready_time > latest_ready_time:
+                    latest_ready_time = order.ready_time
+
+            waiting_time = time_to_sec(latest_ready_time) - self.env.now
             yield self.env.timeout(delay=service_time + max(0, waiting_time))
 
         except Interrupt:
             pass
 
-        self.utilization_time += time_diff(sec_to_time(self.env.now), state_start)
+        self.utilization_time += self.env.now - state_start
 
         self._log(f'Courier {self.courier_id} finishes pick up state')
 
@@ -143,15 +172,18 @@ class Courier(Actor):
     def _dropping_off_state(self, orders: Dict[int, Order]):
         """State that simulates a courier dropping off stuff at the drop off location"""
 
-        self.condition = 'dropping_off'
+        self.update_condition('dropping_off')
 
         self._log(f'Courier {self.courier_id} begins drop off state of orders {list(orders.keys())}')
 
-        state_start = sec_to_time(self.env.now)
+        state_start = self.env.now
         self.dispatcher.courier_dropping_off_event(courier=self)
-        service_time = max(order.drop_off_service_time for order in orders.values())
+        service_time = 0
+        for order in orders.values():
+            if order.drop_off_service_time > service_time:
+                service_time = order.drop_off_service_time
         yield self.env.timeout(delay=service_time)
-        self.utilization_time += time_diff(sec_to_time(self.env.now), state_start)
+        self.utilization_time += self.env.now - state_start
 
         self._log(f'Courier {self.courier_id} finishes drop off state of orders {list(orders.keys())}')
 
@@ -170,7 +202,7 @@ class Courier(Actor):
 
             self._log(f'Courier {self.courier_id} finished relocating and is now at {self.location}')
 
-            self.condition = 'idle'
+            self.update_condition('idle')
             self.dispatcher.courier_idle_event(courier=self)
 
         else:
@@ -181,11 +213,11 @@ class Courier(Actor):
 
         self._log(f'Courier {self.courier_id} received a {notification.type.label} notification')
 
-        if self.condition in ['idle', 'picking_up']:
+        if self.condition in ['idle', 'picking_up'] and self.state is not None and not self.state.triggered:
             try:
                 self.state.interrupt()
 
-            except:
+            except RuntimeError:
                 pass
 
         accepts_notification = yield self.env.process(
@@ -198,8 +230,7 @@ class Courier(Actor):
             self.dispatcher.notification_accepted_event(notification=notification, courier=self)
 
             if (
-                    (isinstance(notification.instruction, list) or bool(notification.instruction.orders)) and
-                    self.active_route is not None
+                    notification.triggers_route_execution and self.active_route is not None
             ) or notification.type == NotificationType.PREPOSITIONING:
                 self.env.process(self._execute_active_route())
 
@@ -225,13 +256,14 @@ class Courier(Actor):
         if self.active_route is None and self.active_stop is None:
             self.earnings = self._calculate_earnings()
 
-            try:
-                self.state.interrupt()
+            if self.state is not None and not self.state.triggered:
+                try:
+                    self.state.interrupt()
 
-            except:
-                pass
+                except RuntimeError:
+                    pass
 
-            self.condition = 'logged_off'
+            self.update_condition('logged_off')
             self.dispatcher.courier_log_off_event(courier=self)
 
         else:
@@ -257,11 +289,24 @@ class Courier(Actor):
     def _execute_active_route(self):
         """State to execute the remainder of a route"""
 
-        stops_remaining = [stop for stop in self.active_route.stops if not stop.visited]
+        route = self.active_route
+
+        self._log(f'Courier {self.courier_id} has {len(route.stops) - route.cursor} stops remaining')
+
+        while True:
+            stops = route.stops
+            cursor = route.cursor
+
+            while cursor < len(stops) and stops[cursor].visited:
+                cursor += 1
 
-        self._log(f'Courier {self.courier_id} has {len(stops_remaining)} stops remaining')
+            route.cursor = cursor
+
+            if cursor >= len(stops):
+                break
+
+            stop = stops[cursor]
 
-        for stop in stops_remaining:
             if self.active_stop != stop:
                 self._log(f'Courier {self.courier_id} will move to next stop')
 
@@ -270,6 +315,10 @@ class Courier(Actor):
             if stop.type != StopType.PREPOSITION:
                 yield self.env.process(self._execute_stop(stop))
 
+            else:
+                # Prepositioning stops are only moved to, never serviced nor marked as visited
+                route.cursor = max(route.cursor, cursor + 1)
+
         self.active_route = None
         self.active_stop = None
 
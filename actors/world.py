@@ -1,14 +1,15 @@
 from asyncore import dispatcher
 import logging
+import subprocess
 from dataclasses import dataclass, field
 from datetime import time
-from os import system
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from random import random
 
-import pandas as pd
+import geohash
+import numpy as np
 from simpy import Environment, Process
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
 from actors.courier import Courier, COURIER_ACCEPTANCE_POLICIES_MAP, COURIER_MOVEMENT_EVALUATION_POLICIES_MAP, \
@@ -18,14 +19,76 @@ from actors.dispatcher import Dispatcher, DISPATCHER_CANCELLATION_POLICIES_MAP,
     DISPATCHER_PREPOSITIONING_EVALUATION_POLICIES_MAP, DISPATCHER_DEMAND_MANAGEMENT_POLICIES_MAP
 from actors.user import User, USER_CANCELLATION_POLICIES_MAP
 from ddbb.config import get_db_url
-from ddbb.queries.couriers_instance_data_query import couriers_query
-from ddbb.queries.orders_instance_data_query import orders_query
+from ddbb.queries.couriers_instance_data_query import couriers_window_query
+from ddbb.queries.orders_instance_data_query import orders_window_query
 from objects.location import Location
 from objects.vehicle import Vehicle
 from settings import settings
-from utils.datetime_utils import sec_to_time, time_to_query_format, time_add
+from utils.datetime_utils import min_to_sec, sec_to_time, time_to_sec, time_add
 from utils.logging_utils import world_log
 
+PROGRESS_LOG_INTERVAL = min_to_sec(1)  # Simulated seconds between progress logs
+
+# Prepared once at import so drivers can cache the query plan instead of re-parsing formatted SQL
+ORDERS_WINDOW_STMT = text(orders_window_query)
+COURIERS_WINDOW_STMT = text(couriers_window_query)
+
+
+class CourierFleetState:
+    """
+    Structure-of-arrays mirror of the hot courier fields (lat, lng, condition).
+    Keeping these in parallel contiguous arrays lets fleet-wide scans (e.g. couriers within a radius)
+    run as vectorized numpy operations instead of loops over Courier objects.
+    """
+
+    CONDITION_CODES = {
+        '': 0,
+        'idle': 1,
+        'moving': 2,
+        'picking_up': 3,
+        'dropping_off': 4,
+        'logged_off': 5
+    }
+
+    def __init__(self, capacity: int = 256):
+        self.size = 0
+        self.courier_ids = np.zeros(capacity, dtype=np.int64)
+        self.lats = np.zeros(capacity, dtype=np.float64)
+        self.lngs = np.zeros(capacity, dtype=np.float64)
+        self.conditions = np.zeros(capacity, dtype=np.uint8)
+
+    def register(self, courier) -> int:
+        """Appends a courier to the mirror, growing the arrays geometrically, and returns its index"""
+
+        if self.size == len(self.courier_ids):
+            new_capacity = len(self.courier_ids) * 2
+            self.courier_ids = np.resize(self.courier_ids, new_capacity)
+            self.lats = np.resize(self.lats, new_capacity)
+            self.lngs = np.resize(self.lngs, new_capacity)
+            self.conditions = np.resize(self.conditions, new_capacity)
+
+        ix = self.size
+        self.size += 1
+        self.courier_ids[ix] = courier.courier_id if courier.courier_id is not None else -1
+        self.conditions[ix] = self.CONDITION_CODES[courier.condition]
+
+        if courier.location is not None:
+            self.lats[ix] = courier.location.lat
+            self.lngs[ix] = courier.location.lng
+
+        return ix
+
+    def update_courier_location(self, courier):
+        """Keeps the location mirror in sync when a courier moves"""
+
+        self.lats[courier.fleet_index] = courier.location.lat
+        self.lngs[courier.fleet_index] = courier.location.lng
+
+    def update_courier_condition(self, courier):
+        """Keeps the condition mirror in sync when a courier changes state"""
+
+        self.conditions[courier.fleet_index] = self.CONDITION_CODES[courier.condition]
+
 
 @dataclass
 class World:
@@ -36,6 +99,8 @@ class World:
     connection: Optional[Engine] = None
     couriers: List[Courier] = field(default_factory=lambda: list())
     dispatcher: Optional[Dispatcher] = None
+    fleet: Optional[CourierFleetState] = None
+    region: Optional[Tuple[str, ...]] = None
     users: List[User] = field(default_factory=lambda: list())
     state: Optional[Process] = None
 
@@ -60,58 +125,113 @@ class World:
             limit_radius = settings.LIMIT_RADIUS,
             substitution_prob = settings.SUBSTITUTION_PROB
         )
-        self.process = self.env.process(self._simulate())
+        self.fleet = CourierFleetState()
+
+        # Settings do not change mid-run, so the policy objects are resolved once instead of per actor
+        self._user_cancellation_policy = USER_CANCELLATION_POLICIES_MAP[settings.USER_CANCELLATION_POLICY]
+        self._courier_acceptance_policy = COURIER_ACCEPTANCE_POLICIES_MAP[settings.COURIER_ACCEPTANCE_POLICY]
+        self._courier_movement_evaluation_policy = COURIER_MOVEMENT_EVALUATION_POLICIES_MAP[
+            settings.COURIER_MOVEMENT_EVALUATION_POLICY
+        ]
+        self._courier_movement_policy = COURIER_MOVEMENT_POLICIES_MAP[settings.COURIER_MOVEMENT_POLICY]
+
+        self._preload_events()
+        self.process = self.env.process(self._schedule_arrivals())
+        self.env.process(self._log_progress())
+
+    def _preload_events(self):
+        """
+        Method that fetches all the orders and couriers for the complete simulation window in a single query each,
+        bucketing them by their placement time and on time.
+        This way the simulation avoids issuing two DDBB round trips for every simulated second.
+        """
+
+        with self.connection.connect() as connection:
+            order_rows = connection.execute(
+                ORDERS_WINDOW_STMT,
+                {
+                    'from_time': settings.CREATE_USERS_FROM,
+                    'until_time': settings.CREATE_USERS_UNTIL,
+                    'instance_id': self.instance
+                }
+            ).mappings().all()
+            courier_rows = connection.execute(
+                COURIERS_WINDOW_STMT,
+                {
+                    'from_time': settings.CREATE_COURIERS_FROM,
+                    'until_time': settings.CREATE_COURIERS_UNTIL,
+                    'instance_id': self.instance
+                }
+            ).mappings().all()
+
+        if self.region is not None:
+            order_rows = [
+                order_info
+                for order_info in order_rows
+                if self._in_region(lat=order_info['pick_up_lat'], lng=order_info['pick_up_lng'])
+            ]
+            courier_rows = [
+                courier_info
+                for courier_info in courier_rows
+                if self._in_region(lat=courier_info['on_lat'], lng=courier_info['on_lng'])
+            ]
+
+        self._orders_by_sec: Dict[time, List[Dict[str, Any]]] = {}
+        for order_info in order_rows:
+            self._orders_by_sec.setdefault(order_info['placement_time'], []).append(dict(order_info))
+
+        self._couriers_by_sec: Dict[time, List[Dict[str, Any]]] = {}
+        for courier_info in courier_rows:
+            self._couriers_by_sec.setdefault(courier_info['on_time'], []).append(dict(courier_info))
+
+    def _in_region(self, lat: float, lng: float) -> bool:
+        """Method to decide if a coordinate pair belongs to the geographic region assigned to this World"""
+
+        code = geohash.encode(lat, lng)
+
+        return any(code.startswith(prefix) for prefix in self.region)
 
-    def _simulate(self):
+    def _schedule_arrivals(self):
         """
         State that simulates the ongoing World of the simulated environment.
-        Each second the World checks the DDBB to see which couriers log on and which users place orders.
-        A general log shows the ongoing simulation progress
+        Instead of polling the preloaded events every simulated second, the World schedules a single timeout
+        per arrival time, waking up only when users place orders or couriers log on.
         """
 
-        while True:
-            orders_info = self._new_orders_info(current_time=sec_to_time(self.env.now))
-            if orders_info is not None:
-                self._new_users_procedure(orders_info)
+        arrivals = []
+        for arrival_time, orders_info in self._orders_by_sec.items():
+            arrivals.append((time_to_sec(arrival_time), 0, orders_info))
 
-            couriers_info = self._new_couriers_info(current_time=sec_to_time(self.env.now))
-            if couriers_info is not None:
-                self._new_couriers_procedure(couriers_info)
+        for arrival_time, couriers_info in self._couriers_by_sec.items():
+            arrivals.append((time_to_sec(arrival_time), 1, couriers_info))
 
-            logging.info(
-                f'Instance {self.instance} | sim time = {sec_to_time(self.env.now)} '
-                f'{world_log(self.dispatcher)}'
-            )
+        arrivals.sort()
 
-            yield self.env.timeout(delay=1)
+        for arrival_sec, is_courier_arrival, arrivals_info in arrivals:
+            if arrival_sec > self.env.now:
+                yield self.env.timeout(delay=arrival_sec - self.env.now)
 
-    def _new_orders_info(self, current_time: time) -> Optional[List[Dict[str, Any]]]:
-        """Method that returns the list of new users that log on at a given time"""
+            if is_courier_arrival:
+                self._new_couriers_procedure(arrivals_info)
 
-        if settings.CREATE_USERS_FROM <= current_time <= settings.CREATE_USERS_UNTIL:
-            query = orders_query.format(
-                placement_time=time_to_query_format(current_time),
-                instance_id=self.instance
-            )
-            orders_df = pd.read_sql(sql=query, con=self.connection)
-        else:
-            orders_df = pd.DataFrame()
+            else:
+                self._new_users_procedure(arrivals_info)
 
-        return orders_df.to_dict('records') if not orders_df.empty else None
+    def _log_progress(self):
+        """State that periodically logs the ongoing simulation progress"""
 
-    def _new_couriers_info(self, current_time: time) -> Optional[List[Dict[str, Any]]]:
-        """Method that returns the list of new couriers that log on at a given time"""
+        logger = logging.getLogger(__name__)
 
-        if settings.CREATE_COURIERS_FROM <= current_time <= settings.CREATE_COURIERS_UNTIL:
-            query = couriers_query.format(
-                on_time=time_to_query_format(current_time),
-                instance_id=self.instance
-            )
-            couriers_df = pd.read_sql(sql=query, con=self.connection)
-        else:
-            couriers_df = pd.DataFrame()
+        while True:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    'Instance %s | sim time = %s %s',
+                    self.instance,
+                    sec_to_time(self.env.now),
+                    world_log(self.dispatcher)
+                )
 
-        return couriers_df.to_dict('records') if not couriers_df.empty else None
+            yield self.env.timeout(delay=PROGRESS_LOG_INTERVAL)
 
     def _new_users_procedure(self, orders_info: List[Dict[str, Any]]):
         """Method to establish how a new user is created in the World"""
@@ -120,7 +240,7 @@ class World:
             user = User(
                 env=self.env,
                 dispatcher=self.dispatcher,
-                cancellation_policy=USER_CANCELLATION_POLICIES_MAP[settings.USER_CANCELLATION_POLICY],
+                cancellation_policy=self._user_cancellation_policy,
                 user_id=order_info['order_id']
             )
             
@@ -164,16 +284,15 @@ class World:
             courier = Courier(
                 env=self.env,
                 dispatcher=self.dispatcher,
-                acceptance_policy=COURIER_ACCEPTANCE_POLICIES_MAP[settings.COURIER_ACCEPTANCE_POLICY],
-                movement_evaluation_policy=COURIER_MOVEMENT_EVALUATION_POLICIES_MAP[
-                    settings.COURIER_MOVEMENT_EVALUATION_POLICY
-                ],
-                movement_policy=COURIER_MOVEMENT_POLICIES_MAP[settings.COURIER_MOVEMENT_POLICY],
+                acceptance_policy=self._courier_acceptance_policy,
+                movement_evaluation_policy=self._courier_movement_evaluation_policy,
+                movement_policy=self._courier_movement_policy,
                 courier_id=courier_info['courier_id'],
                 vehicle=Vehicle.from_label(label=courier_info['vehicle']),
                 location=Location(lat=courier_info['on_lat'], lng=courier_info['on_lng']),
                 on_time=courier_info['on_time'],
-                off_time=courier_info['off_time']
+                off_time=courier_info['off_time'],
+                fleet=self.fleet
             )
             self.couriers.append(courier)
 
@@ -188,16 +307,29 @@ class World:
 
         warm_up_time_start = time_add(settings.SIMULATE_FROM, settings.WARM_UP_TIME)
 
-        for order_id, order in self.dispatcher.canceled_orders.copy().items():
-            if order.cancellation_time < warm_up_time_start:
-                del self.dispatcher.canceled_orders[order_id]
+        warmed_up_order_ids = [
+            order_id
+            for order_id, order in self.dispatcher.canceled_orders.items()
+            if order.cancellation_time < warm_up_time_start
+        ]
+        for order_id in warmed_up_order_ids:
+            del self.dispatcher.canceled_orders[order_id]
 
-        for order_id, order in self.dispatcher.fulfilled_orders.copy().items():
-            if order.drop_off_time < warm_up_time_start:
-                del self.dispatcher.fulfilled_orders[order_id]
+        warmed_up_order_ids = [
+            order_id
+            for order_id, order in self.dispatcher.fulfilled_orders.items()
+            if order.drop_off_time < warm_up_time_start
+        ]
+        for order_id in warmed_up_order_ids:
+            del self.dispatcher.fulfilled_orders[order_id]
 
         logging.info(f'Instance {self.instance} | Post processed the simulation.')
-        system(
-            f'say The simulation process for instance {self.instance}, '
-            f'matching policy {settings.DISPATCHER_MATCHING_POLICY} has finished.'
-        )
+
+        if settings.NOTIFY_ON_COMPLETE:
+            subprocess.Popen(
+                [
+                    'say',
+                    f'The simulation process for instance {self.instance}, '
+                    f'matching policy {settings.DISPATCHER_MATCHING_POLICY} has finished.'
+                ]
+            )
@@ -8,4 +8,15 @@ couriers_query = """
         off_time
     FROM couriers_instance_data
     WHERE on_time = {on_time} AND instance_id = {instance_id}
+"""
+couriers_window_query = """
+    SELECT
+        courier_id,
+        vehicle,
+        on_lat,
+        on_lng,
+        on_time,
+        off_time
+    FROM couriers_instance_data
+    WHERE on_time BETWEEN :from_time AND :until_time AND instance_id = :instance_id
 """
\ No newline at end of file
@@ -14,3 +14,19 @@ orders_query = """
     FROM orders_instance_data
     WHERE placement_time = {placement_time} AND instance_id = {instance_id}
 """
+orders_window_query = """
+    SELECT
+        order_id,
+        pick_up_lat,
+        pick_up_lng,
+        drop_off_lat,
+        drop_off_lng,
+        placement_time,
+        preparation_time,
+        ready_time,
+        expected_drop_off_time,
+        pick_up_lat2,
+        pick_up_lng2
+    FROM orders_instance_data
+    WHERE placement_time BETWEEN :from_time AND :until_time AND instance_id = :instance_id
+"""
@@ -1,10 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any, Dict
 
 from numpy import int64
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchingMetric:
     """Class to store results of a dispatch event"""
 
@@ -20,4 +20,4 @@ class MatchingMetric:
     def calculate_metrics(self) -> Dict[str, Any]:
         """Method to calculate metrics of a dispatch event"""
 
-        return self.__dict__
+        return asdict(self)
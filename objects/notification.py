@@ -32,6 +32,19 @@ class Notification:
     instruction: Optional[Union[Route, List[Stop]]]
     type: NotificationType = NotificationType.PICK_UP_DROP_OFF
 
+    def __post_init__(self):
+        """Immediate instantiation of some properties"""
+
+        self._refresh_triggers_route_execution()
+
+    def _refresh_triggers_route_execution(self):
+        """Precomputes whether the instruction carries work, so couriers test a single attribute"""
+
+        instruction = self.instruction
+        self.triggers_route_execution = (
+            instruction is not None and (isinstance(instruction, list) or bool(instruction.orders))
+        )
+
     def update(self, processed_order_ids: List[int]):
         """Method to update a notification if some of its orders have been processed"""
 
@@ -61,3 +74,5 @@ class Notification:
                     num_stops += 1
 
             self.instruction = updated_stops
+
+        self._refresh_triggers_route_execution()
@@ -10,13 +10,16 @@ from objects.vehicle import Vehicle
 from utils.datetime_utils import time_to_sec
 
 
-@dataclass
+@dataclass(slots=True)
 class Route:
     """Class describing a route for either moving or fulfilling"""
 
+    cursor: int = 0
     initial_prospect: int = None
     num_stops: Optional[int] = 0
     orders: Optional[Dict[int, Order]] = field(default_factory=lambda: dict())
+    road_distance: Optional[float] = None
+    road_duration: Optional[float] = None
     route_id: Optional[str] = ''
     stops: Optional[List[Stop]] = field(default_factory=lambda: list())
     time: Optional[Dict[Any, float]] = field(default_factory=lambda: dict())
@@ -93,6 +96,7 @@ class Route:
             if order_id not in processed_order_ids
         }
         self.num_stops = len(self.stops)
+        self.cursor = self._first_unvisited()
         self.time = self._calculate_time()
 
     def add_order(self, order: Order, route_position: Optional[int] = 1):
@@ -177,6 +181,16 @@ class Route:
 
         self.stops = stops
         self.num_stops = len(self.stops)
+        self.cursor = self._first_unvisited()
+
+    def _first_unvisited(self) -> int:
+        """Method to find the position of the first stop that hasn't been visited"""
+
+        for ix, stop in enumerate(self.stops):
+            if not stop.visited:
+                return ix
+
+        return len(self.stops)
 
     def calculate_time_update(self, destination: Location, origin: Location, service_time: float) -> Dict[Any, float]:
         """Method to update the route time based on a new stop"""
@@ -27,7 +27,7 @@ class StopType(IntEnum):
         return LABELS[self]
 
 
-@dataclass
+@dataclass(slots=True)
 class Stop:
     """Class describing the stop of a route"""
 
@@ -0,0 +1,45 @@
+import math
+
+try:
+    from numba import njit
+
+except ImportError:
+    njit = None
+
+EARTH_RADIUS_KM = 6371.0088  # Mean earth radius used by the haversine package
+KM_PER_DEG = 111.32  # Kilometers per degree of latitude
+BOUNDARY_TOLERANCE = 0.05  # Relative band around the radius where the exact haversine decides
+
+
+def haversine_fast(lat_0: float, lng_0: float, lat_1: float, lng_1: float) -> float:
+    """Computes the haversine distance [km] between two coordinate pairs"""
+
+    rad_lat_0 = math.radians(lat_0)
+    rad_lat_1 = math.radians(lat_1)
+    d_lat = rad_lat_1 - rad_lat_0
+    d_lng = math.radians(lng_1 - lng_0)
+    a = math.sin(d_lat / 2) ** 2 + math.cos(rad_lat_0) * math.cos(rad_lat_1) * math.sin(d_lng / 2) ** 2
+
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def within_radius(lat_0: float, lng_0: float, lat_1: float, lng_1: float, radius: float) -> bool:
+    """
+    Decides if two coordinate pairs lie within a radius [km] of each other.
+    A cheap equirectangular approximation settles points far from the boundary;
+    the exact haversine is only computed inside the boundary band.
+    """
+
+    d_lat = lat_0 - lat_1
+    d_lng = (lng_0 - lng_1) * math.cos(math.radians((lat_0 + lat_1) / 2))
+    distance = math.sqrt(d_lat * d_lat + d_lng * d_lng) * KM_PER_DEG
+
+    if abs(distance - radius) > radius * BOUNDARY_TOLERANCE:
+        return distance <= radius
+
+    return haversine_fast(lat_0, lng_0, lat_1, lng_1) <= radius
+
+
+if njit is not None:
+    haversine_fast = njit(cache=True, fastmath=True)(haversine_fast)
+    within_radius = njit(cache=True, fastmath=True)(within_radius)
@@ -0,0 +1,33 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+except ImportError:
+    njit = None
+
+EARTH_RADIUS_KM = 6371.0088  # Mean earth radius used by the haversine package
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def leg_distances(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """Computes the haversine distance [km] of each leg between consecutive route stops"""
+
+        num_legs = lats.shape[0] - 1
+        distances = np.empty(num_legs, dtype=np.float64)
+
+        for ix in range(num_legs):
+            lat_0 = math.radians(lats[ix])
+            lat_1 = math.radians(lats[ix + 1])
+            d_lat = lat_1 - lat_0
+            d_lng = math.radians(lngs[ix + 1] - lngs[ix])
+            a = math.sin(d_lat / 2) ** 2 + math.cos(lat_0) * math.cos(lat_1) * math.sin(d_lng / 2) ** 2
+            distances[ix] = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+        return distances
+
+else:
+    leg_distances = None
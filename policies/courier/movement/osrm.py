@@ -26,4 +26,4 @@ class OSRMMovementPolicy(CourierMovementPolicy):
 
             yield env.timeout(delay=time)
 
-            courier.location = next_stop.location
+            courier.update_location(next_stop.location)
@@ -1,5 +1,6 @@
 import random
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import geohash
 
@@ -8,6 +9,13 @@ from objects.location import Location
 from policies.courier.movement_evaluation.courier_movement_evaluation_policy import CourierMovementEvaluationPolicy
 
 
+@lru_cache(maxsize=50_000)
+def _neighbor_centers(current_geohash: str) -> Tuple[Tuple[float, float], ...]:
+    """Decoded centers of the neighboring geohashes, cached since couriers revisit the same cells"""
+
+    return tuple(geohash.decode(neighbor) for neighbor in geohash.neighbors(current_geohash))
+
+
 class NeighborsMoveEvalPolicy(CourierMovementEvaluationPolicy):
     """
     Class containing the policy that decides how a courier evaluates moving about the city.
@@ -20,9 +28,7 @@ class NeighborsMoveEvalPolicy(CourierMovementEvaluationPolicy):
 
         if random.random() <= settings.COURIER_MOVEMENT_PROBABILITY:
             current_geohash = geohash.encode(*current_location.coordinates, precision=6)
-            geohash_neighbors = geohash.neighbors(current_geohash)
-            destination_geohash = random.choice(geohash_neighbors)
-            destination_coordinates = geohash.decode(destination_geohash)
+            destination_coordinates = random.choice(_neighbor_centers(current_geohash))
 
             return Location(lat=destination_coordinates[0], lng=destination_coordinates[1])
 
@@ -0,0 +1,200 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+except ImportError:
+    njit = None
+
+EARTH_RADIUS_KM = 6371.0088  # Mean earth radius used by the haversine package
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def prospects_within(
+            o_lats: np.ndarray,
+            o_lngs: np.ndarray,
+            c_lats: np.ndarray,
+            c_lngs: np.ndarray,
+            max_distance: float
+    ) -> np.ndarray:
+        """
+        Emits the (order_ix, courier_ix) pairs whose haversine distance [km] is within the maximum,
+        fusing the distance computation with the threshold test so the full distance matrix
+        is never materialized.
+        """
+
+        num_orders = o_lats.shape[0]
+        num_couriers = c_lats.shape[0]
+
+        counts = np.zeros(num_orders, dtype=np.int64)
+        for o in prange(num_orders):
+            lat_o = math.radians(o_lats[o])
+            cos_lat_o = math.cos(lat_o)
+            hits = 0
+
+            for c in range(num_couriers):
+                lat_c = math.radians(c_lats[c])
+                d_lat = lat_o - lat_c
+                d_lng = math.radians(o_lngs[o] - c_lngs[c])
+                a = math.sin(d_lat / 2) ** 2 + cos_lat_o * math.cos(lat_c) * math.sin(d_lng / 2) ** 2
+
+                if 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a)) <= max_distance:
+                    hits += 1
+
+            counts[o] = hits
+
+        offsets = np.zeros(num_orders + 1, dtype=np.int64)
+        for o in range(num_orders):
+            offsets[o + 1] = offsets[o] + counts[o]
+
+        prospects = np.empty((offsets[num_orders], 2), dtype=np.int64)
+        for o in prange(num_orders):
+            lat_o = math.radians(o_lats[o])
+            cos_lat_o = math.cos(lat_o)
+            cursor = offsets[o]
+
+            for c in range(num_couriers):
+                lat_c = math.radians(c_lats[c])
+                d_lat = lat_o - lat_c
+                d_lng = math.radians(o_lngs[o] - c_lngs[c])
+                a = math.sin(d_lat / 2) ** 2 + cos_lat_o * math.cos(lat_c) * math.sin(d_lng / 2) ** 2
+
+                if 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a)) <= max_distance:
+                    prospects[cursor, 0] = o
+                    prospects[cursor, 1] = c
+                    cursor += 1
+
+        return prospects
+
+    @njit(cache=True, parallel=True)
+    def fill_estimations(
+            prospects: np.ndarray,
+            durations: np.ndarray,
+            distances: np.ndarray,
+            service_times: np.ndarray,
+            num_orders: int,
+            num_couriers: int,
+            out_distances: np.ndarray,
+            out_times: np.ndarray
+    ):
+        """Fills the per-prospect distance [km] and time [s] estimations from the OSRM table matrices"""
+
+        for k in prange(prospects.shape[0]):
+            order_ix = prospects[k, 0]
+            courier_ix = prospects[k, 1]
+            pick_up_row = num_couriers + order_ix
+            drop_off_col = num_orders + order_ix
+            out_distances[k] = (distances[courier_ix, order_ix] + distances[pick_up_row, drop_off_col]) / 1000
+            out_times[k] = (
+                durations[courier_ix, order_ix] + durations[pick_up_row, drop_off_col] + service_times[order_ix]
+            )
+
+else:
+    prospects_within = None
+    fill_estimations = None
+
+
+def _auction_core(cost: np.ndarray, eps_floor: float, infeasible_cost: float) -> np.ndarray:
+    """
+    Forward auction over a cost matrix whose bidder side (rows) is not larger than the object side.
+    Each bidder gets a dedicated slack column meaning "remain unassigned", so a perfect matching
+    always exists, prices stay bounded and the auction terminates.
+    """
+
+    num_bidders, num_objects = cost.shape
+    num_ext = num_objects + num_bidders
+    prices = np.zeros(num_ext, dtype=np.float64)
+    owner = np.full(num_ext, -1, dtype=np.int64)
+    assigned = np.full(num_bidders, -1, dtype=np.int64)
+
+    max_cost = 0.0
+    for bidder_ix in range(num_bidders):
+        for object_ix in range(num_objects):
+            if cost[bidder_ix, object_ix] < infeasible_cost and cost[bidder_ix, object_ix] > max_cost:
+                max_cost = cost[bidder_ix, object_ix]
+
+    # Expensive enough that dropping a matchable bidder never beats any chain of real matches
+    slack_cost = (min(num_bidders, num_objects) + 1) * (max_cost + eps_floor) + max_cost
+
+    # The total assignment cost lands within num_bidders * eps of the optimum
+    eps = max_cost / (10.0 * (num_bidders + 1))
+    if eps < eps_floor:
+        eps = eps_floor
+
+    stack = np.empty(num_bidders, dtype=np.int64)
+    for bidder_ix in range(num_bidders):
+        stack[bidder_ix] = bidder_ix
+    top = num_bidders
+
+    max_rounds = 10_000 * (num_bidders + num_objects) + 100
+    rounds = 0
+    while top > 0 and rounds < max_rounds:
+        rounds += 1
+        top -= 1
+        bidder_ix = stack[top]
+
+        slack_ix = num_objects + bidder_ix
+        best_value = -slack_cost - prices[slack_ix]
+        second_value = -np.inf
+        best_object = slack_ix
+
+        for object_ix in range(num_objects):
+            if cost[bidder_ix, object_ix] >= infeasible_cost:
+                continue
+
+            value = -cost[bidder_ix, object_ix] - prices[object_ix]
+            if value > best_value:
+                second_value = best_value
+                best_value = value
+                best_object = object_ix
+
+            elif value > second_value:
+                second_value = value
+
+        if second_value == -np.inf:
+            second_value = best_value
+
+        prices[best_object] += best_value - second_value + eps
+        previous = owner[best_object]
+        if previous != -1:
+            assigned[previous] = -1
+            stack[top] = previous
+            top += 1
+
+        owner[best_object] = bidder_ix
+        assigned[bidder_ix] = best_object
+
+    for bidder_ix in range(num_bidders):
+        if assigned[bidder_ix] >= num_objects:
+            assigned[bidder_ix] = -1
+
+    return assigned
+
+
+if njit is not None:
+    _auction_core = njit(cache=True)(_auction_core)
+
+
+def auction_assign(cost: np.ndarray, eps: float, infeasible_cost: float) -> np.ndarray:
+    """
+    Solves the order-to-courier assignment with the Bertsekas auction algorithm.
+    The smaller side always bids, so the price escalation that a surplus of bidders causes
+    never happens; the returned array maps each order index to its courier index,
+    or -1 when the order stays unassigned.
+    """
+
+    num_orders, num_couriers = cost.shape
+
+    if num_orders <= num_couriers:
+        return _auction_core(cost, eps, infeasible_cost)
+
+    by_courier = _auction_core(np.ascontiguousarray(cost.T), eps, infeasible_cost)
+    assigned = np.full(num_orders, -1, dtype=np.int64)
+    for courier_ix in range(num_couriers):
+        if by_courier[courier_ix] != -1:
+            assigned[by_courier[courier_ix]] = courier_ix
+
+    return assigned
@@ -1,8 +1,9 @@
 import time
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 import numpy as np
-from haversine import haversine
+from haversine import haversine_vector
 
 from actors.courier import Courier
 from objects.matching_metric import MatchingMetric
@@ -10,10 +11,21 @@ from objects.notification import Notification, NotificationType
 from objects.order import Order
 from objects.route import Route
 from objects.stop import Stop, StopType
+from policies.dispatcher.matching._kernels import auction_assign, fill_estimations, prospects_within
 from policies.dispatcher.matching.dispatcher_matching_policy import DispatcherMatchingPolicy
 from services.osrm_service import OSRMService
 from settings import settings
 
+try:
+    from scipy.optimize import linear_sum_assignment
+
+except ImportError:
+    linear_sum_assignment = None
+
+INFEASIBLE_COST = 1e15  # Cost assigned to non-prospect pairs so the solver never selects them
+AUCTION_EPSILON = 1e-3  # Minimum bid increment of the auction solver, bounding its suboptimality
+CONCURRENT_ESTIMATIONS_MIN = 8  # Prospect count from which per-pair estimations overlap their OSRM waits
+
 
 class GreedyMatchingPolicy(DispatcherMatchingPolicy):
     """Class containing the policy for the dispatcher to execute a greedy matching"""
@@ -26,59 +38,78 @@ class GreedyMatchingPolicy(DispatcherMatchingPolicy):
     ) -> Tuple[List[Notification], MatchingMetric]:
         """Implementation of the policy"""
 
-        matching_start_time = time.time()
+        matching_start_time = time.perf_counter()
 
         idle_couriers = [
             courier
             for courier in couriers
             if courier.condition == 'idle' and courier.active_route is None
         ]
-        prospects = self._get_prospects(orders, idle_couriers)
+
+        # The coordinate arrays are materialized once per round and handed to every numeric step,
+        # instead of each helper re-walking the order and courier objects
+        order_coordinates = np.array([order.pick_up_at.coordinates for order in orders]) if orders else None
+        courier_coordinates = (
+            np.array([courier.location.coordinates for courier in idle_couriers]) if idle_couriers else None
+        )
+
+        prospects = self._get_prospects(orders, idle_couriers, order_coordinates, courier_coordinates)
+
+        # Rounds without any prospect skip the estimations and the solver entirely
+        if not orders or not idle_couriers or prospects.size == 0:
+            return [], MatchingMetric(
+                constraints=0,
+                couriers=len(couriers),
+                matches=0,
+                matching_time=time.perf_counter() - matching_start_time,
+                orders=len(orders),
+                routes=len(orders),
+                routing_time=0.,
+                variables=0
+            )
+
         estimations = self._get_estimations(orders, idle_couriers, prospects)
 
-        notifications, notified_couriers = [], np.array([])
-        if bool(prospects.tolist()) and bool(estimations.tolist()) and bool(orders) and bool(idle_couriers):
-            for order_ix, order in enumerate(orders):
-                mask = np.where(np.logical_and(
-                    prospects[:, 0] == order_ix,
-                    np.logical_not(np.isin(prospects[:, 1], notified_couriers))
-                ))
-
-                if bool(mask[0].tolist()):
-                    order_prospects = prospects[mask]
-                    order_estimations = estimations[mask]
-                    min_time = order_estimations['time'].min()
-                    selection_mask = np.where(order_estimations['time'] == min_time)
-                    selected_prospect = order_prospects[selection_mask][0]
-
-                    notifications.append(
-                        Notification(
-                            courier=couriers[selected_prospect[1]],
-                            type=NotificationType.PICK_UP_DROP_OFF,
-                            instruction=Route(
-                                orders={order.order_id: order},
-                                stops=[
-                                    Stop(
-                                        location=order.pick_up_at,
-                                        orders={order.order_id: order},
-                                        position=0,
-                                        type=StopType.PICK_UP,
-                                        visited=False
-                                    ),
-                                    Stop(
-                                        location=order.drop_off_at,
-                                        orders={order.order_id: order},
-                                        position=1,
-                                        type=StopType.DROP_OFF,
-                                        visited=False
-                                    )
-                                ]
-                            )
+        notifications = []
+        if estimations.size > 0:
+            if settings.DISPATCHER_MATCHING_SOLVER == 'hungarian' and linear_sum_assignment is not None:
+                matches = self._assign_hungarian(len(orders), len(idle_couriers), prospects, estimations)
+
+            elif settings.DISPATCHER_MATCHING_SOLVER == 'auction':
+                matches = self._assign_auction(len(orders), len(idle_couriers), prospects, estimations)
+
+            else:
+                matches = self._assign_greedy(prospects, estimations)
+
+            for order_ix, courier_ix in matches:
+                order = orders[order_ix]
+                notifications.append(
+                    Notification(
+                        courier=idle_couriers[courier_ix],
+                        type=NotificationType.PICK_UP_DROP_OFF,
+                        instruction=Route(
+                            orders={order.order_id: order},
+                            stops=[
+                                Stop(
+                                    location=order.pick_up_at,
+                                    orders={order.order_id: order},
+                                    position=0,
+                                    type=StopType.PICK_UP,
+                                    visited=False
+                                ),
+                                Stop(
+                                    location=order.drop_off_at,
+                                    orders={order.order_id: order},
+                                    position=1,
+                                    type=StopType.DROP_OFF,
+                                    visited=False
+                                )
+                            ]
                         )
                     )
-                    notified_couriers = np.append(notified_couriers, selected_prospect[1])
+                )
 
-        matching_time = time.time() - matching_start_time
+        matching_time = time.perf_counter() - matching_start_time
 
         matching_metric = MatchingMetric(
             constraints=0,
@@ -94,50 +125,212 @@ class GreedyMatchingPolicy(DispatcherMatchingPolicy):
         return notifications, matching_metric
 
     @staticmethod
-    def _get_prospects(orders: List[Order], couriers: List[Courier]) -> np.ndarray:
+    def _assign_greedy(prospects: np.ndarray, estimations: np.ndarray) -> List[Tuple[int, int]]:
+        """Method to assign each order greedily, in order, to its fastest not-yet-notified courier"""
+
+        # One argsort turns the per-order lookups into contiguous slices, instead of
+        # rebuilding Python buckets (or rescanning all prospects) for every order
+        order_column = prospects[:, 0]
+        sorted_rows = np.argsort(order_column, kind='stable')
+        sorted_orders = order_column[sorted_rows]
+        unique_orders = np.unique(sorted_orders)
+        starts = np.searchsorted(sorted_orders, unique_orders, side='left')
+        ends = np.searchsorted(sorted_orders, unique_orders, side='right')
+
+        matches, notified_couriers = [], set()
+        for order_ix, start, end in zip(unique_orders, starts, ends):
+            order_ix = int(order_ix)
+            candidate_rows = [
+                row_ix
+                for row_ix in sorted_rows[start:end]
+                if int(prospects[row_ix, 1]) not in notified_couriers
+            ]
+
+            if candidate_rows:
+                best = int(estimations['time'][candidate_rows].argmin())
+                courier_ix = int(prospects[candidate_rows[best], 1])
+                matches.append((order_ix, courier_ix))
+                notified_couriers.add(courier_ix)
+
+        return matches
+
+    @staticmethod
+    def _assign_hungarian(
+            num_orders: int,
+            num_couriers: int,
+            prospects: np.ndarray,
+            estimations: np.ndarray
+    ) -> List[Tuple[int, int]]:
+        """
+        Method to assign orders to couriers minimizing the total estimated time,
+        solving the bipartite assignment with the Kuhn-Munkres algorithm.
+        Pairs that are not prospects carry a prohibitive cost and are discarded from the solution.
+        """
+
+        cost = np.full((num_orders, num_couriers), INFEASIBLE_COST)
+        cost[prospects[:, 0], prospects[:, 1]] = estimations['time']
+        order_ixs, courier_ixs = linear_sum_assignment(cost)
+
+        return [
+            (int(order_ix), int(courier_ix))
+            for order_ix, courier_ix in zip(order_ixs, courier_ixs)
+            if cost[order_ix, courier_ix] < INFEASIBLE_COST
+        ]
+
+    @staticmethod
+    def _assign_auction(
+            num_orders: int,
+            num_couriers: int,
+            prospects: np.ndarray,
+            estimations: np.ndarray
+    ) -> List[Tuple[int, int]]:
+        """Method to assign orders to couriers with the auction algorithm, an eps-optimal alternative
+        to the Hungarian solver that scales better on large fleets"""
+
+        cost = np.full((num_orders, num_couriers), INFEASIBLE_COST)
+        cost[prospects[:, 0], prospects[:, 1]] = estimations['time']
+        assigned = auction_assign(cost, AUCTION_EPSILON, INFEASIBLE_COST)
+
+        return [
+            (order_ix, int(courier_ix))
+            for order_ix, courier_ix in enumerate(assigned)
+            if courier_ix != -1
+        ]
+
+    @staticmethod
+    def _get_prospects(
+            orders: List[Order],
+            couriers: List[Courier],
+            order_coordinates: Optional[np.ndarray] = None,
+            courier_coordinates: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Method to obtain the matching prospects between orders and couriers"""
 
-        prospects = []
-        for order_ix, order in enumerate(orders):
-            for courier_ix, courier in enumerate(couriers):
-                distance_to_pick_up = haversine(courier.location.coordinates, order.pick_up_at.coordinates)
-                if distance_to_pick_up <= settings.DISPATCHER_PROSPECTS_MAX_DISTANCE:
-                    prospects.append((order_ix, courier_ix))
+        if not orders or not couriers:
+            return np.array([])
 
-        return np.array(prospects)
+        if order_coordinates is None:
+            order_coordinates = np.array([order.pick_up_at.coordinates for order in orders])
+
+        if courier_coordinates is None:
+            courier_coordinates = np.array([courier.location.coordinates for courier in couriers])
+
+        if prospects_within is not None:
+            return prospects_within(
+                np.ascontiguousarray(order_coordinates[:, 0]),
+                np.ascontiguousarray(order_coordinates[:, 1]),
+                np.ascontiguousarray(courier_coordinates[:, 0]),
+                np.ascontiguousarray(courier_coordinates[:, 1]),
+                float(settings.DISPATCHER_PROSPECTS_MAX_DISTANCE)
+            )
+
+        distances_to_pick_up = haversine_vector(order_coordinates, courier_coordinates, comb=True).T
+
+        return np.argwhere(distances_to_pick_up <= settings.DISPATCHER_PROSPECTS_MAX_DISTANCE)
+
+    @staticmethod
+    def _get_estimations_from_table(
+            orders: List[Order],
+            couriers: List[Courier],
+            prospects: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """
+        Method to obtain all the prospect estimations from a single OSRM table request,
+        instead of routing every (order, courier) pair individually.
+        Returns None when the table service is unavailable.
+        """
+
+        sources = [courier.location for courier in couriers] + [order.pick_up_at for order in orders]
+        destinations = [order.pick_up_at for order in orders] + [order.drop_off_at for order in orders]
+        table = OSRMService.get_table(sources=sources, destinations=destinations)
+
+        if table is None:
+            return None
+
+        durations, distances = table
+        service_times = np.array(
+            [order.pick_up_service_time + order.drop_off_service_time for order in orders],
+            dtype=np.float64
+        )
+
+        estimations = np.empty(len(prospects), dtype=[('distance', np.float64), ('time', np.float64)])
+
+        if fill_estimations is not None:
+            # Each prospect reads independent matrix cells, so the fill parallelizes across prospects
+            out_distances = np.empty(len(prospects), dtype=np.float64)
+            out_times = np.empty(len(prospects), dtype=np.float64)
+            fill_estimations(
+                np.ascontiguousarray(prospects),
+                durations,
+                distances,
+                service_times,
+                len(orders),
+                len(couriers),
+                out_distances,
+                out_times
+            )
+            estimations['distance'] = out_distances
+            estimations['time'] = out_times
+
+            return estimations
+
+        order_ixs, courier_ixs = prospects[:, 0], prospects[:, 1]
+        pick_up_rows = len(couriers) + order_ixs
+        drop_off_cols = len(orders) + order_ixs
+        estimations['distance'] = (
+            distances[courier_ixs, order_ixs] + distances[pick_up_rows, drop_off_cols]
+        ) / 1000
+        estimations['time'] = (
+            durations[courier_ixs, order_ixs] +
+            durations[pick_up_rows, drop_off_cols] +
+            service_times[order_ixs]
+        )
+
+        return estimations
 
     @staticmethod
     def _get_estimations(orders: List[Order], couriers: List[Courier], prospects: np.ndarray) -> np.ndarray:
         """Method to obtain the time estimations from the matching prospects"""
 
-        estimations = [None] * len(prospects)
-        for ix, (order_ix, courier_ix) in enumerate(prospects):
-            order, courier = orders[order_ix], couriers[courier_ix]
-            route = Route(
-                orders={order.order_id: order},
-                stops=[
-                    Stop(
-                        location=order.pick_up_at,
-                        orders={order.order_id: order},
-                        position=0,
-                        type=StopType.PICK_UP,
-                        visited=False
-                    ),
-                    Stop(
-                        location=order.drop_off_at,
-                        orders={order.order_id: order},
-                        position=1,
-                        type=StopType.DROP_OFF,
-                        visited=False
-                    )
-                ]
-            )
-            distance, time = OSRMService.estimate_route_properties(
+        if len(prospects) > 0:
+            estimations = GreedyMatchingPolicy._get_estimations_from_table(orders, couriers, prospects)
+
+            if estimations is not None:
+                return estimations
+
+        def estimate_prospect(prospect) -> Tuple[float, float]:
+            order, courier = orders[prospect[0]], couriers[prospect[1]]
+
+            # Estimating the two legs directly hits the memoized travel metrics, so the
+            # pick up -> drop off leg an order shares across its prospects is computed once
+            to_pick_up = OSRMService.estimate_travelling_properties(
                 origin=courier.location,
-                route=route,
+                destination=order.pick_up_at,
                 vehicle=courier.vehicle
             )
-            time += (order.pick_up_service_time + order.drop_off_service_time)
-            estimations[ix] = (distance, time)
+            to_drop_off = OSRMService.estimate_travelling_properties(
+                origin=order.pick_up_at,
+                destination=order.drop_off_at,
+                vehicle=courier.vehicle
+            )
+            distance = to_pick_up[0] + to_drop_off[0]
+            estimated_time = (
+                to_pick_up[1] + to_drop_off[1] + order.pick_up_service_time + order.drop_off_service_time
+            )
+
+            return distance, estimated_time
+
+        estimations = np.empty(len(prospects), dtype=[('distance', np.float64), ('time', np.float64)])
+
+        if len(prospects) >= CONCURRENT_ESTIMATIONS_MIN:
+            with ThreadPoolExecutor(max_workers=min(32, len(prospects))) as executor:
+                results = list(executor.map(estimate_prospect, prospects))
+
+        else:
+            results = map(estimate_prospect, prospects)
+
+        for ix, (distance, estimated_time) in enumerate(results):
+            estimations['distance'][ix] = distance
+            estimations['time'][ix] = estimated_time
 
-        return np.array(estimations, dtype=[('distance', np.float64), ('time', np.float64)])
+        return estimations
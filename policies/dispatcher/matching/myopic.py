@@ -59,14 +59,14 @@ class MyopicMatchingPolicy(DispatcherMatchingPolicy):
     ) -> Tuple[List[Notification], MatchingMetric]:
         """Implementation of the policy where routes are first calculated and later assigned"""
 
-        routing_start_time = time.time()
+        routing_start_time = time.perf_counter()
         routes = self._generate_routes(orders, couriers, env_time)
-        routing_time = time.time() - routing_start_time
+        routing_time = time.perf_counter() - routing_start_time
 
-        matching_start_time = time.time()
+        matching_start_time = time.perf_counter()
         prospects = self._generate_matching_prospects(routes, couriers, env_time)
 
-        if bool(prospects.tolist()):
+        if prospects.size > 0:
             costs = self._generate_matching_costs(routes, couriers, prospects, env_time)
             problem = MatchingProblemBuilder.build(routes, couriers, prospects, costs)
 
@@ -91,7 +91,7 @@ class MyopicMatchingPolicy(DispatcherMatchingPolicy):
             )
             notifications = []
 
-        matching_time = time.time() - matching_start_time
+        matching_time = time.perf_counter() - matching_start_time
 
         matching_metric = MatchingMetric(
             constraints=len(model.constraints),
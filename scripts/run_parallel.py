@@ -0,0 +1,63 @@
+import argparse
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List
+
+from actors.world import World
+from services.metrics_service import MetricsService
+from settings import settings
+from utils.datetime_utils import time_to_sec
+from utils.logging_utils import configure_logs
+from utils.simpy_utils import TunedEnvironment
+
+
+def run_single_instance(instance: int) -> int:
+    """Runs the complete simulation of a single instance, exactly as simulate.py does"""
+
+    configure_logs()
+    random.seed(settings.SEED)
+
+    env = TunedEnvironment(initial_time=time_to_sec(settings.SIMULATE_FROM))
+    world = World(env=env, instance=instance)
+    env.run(until=time_to_sec(settings.SIMULATE_UNTIL))
+    world.post_process()
+
+    metrics_service = MetricsService(instance=instance)
+    metrics_service.calculate_and_save_metrics(world.dispatcher)
+
+    return instance
+
+
+def run_instances(instance_ids: List[int], n_workers: int):
+    """
+    Runs the desired instances in parallel, one process per instance.
+    Instances are independent, so each worker creates its own Environment, World and DDBB connection pool.
+    """
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = {executor.submit(run_single_instance, instance): instance for instance in instance_ids}
+
+        for future in as_completed(futures):
+            instance = futures[future]
+
+            try:
+                future.result()
+                logging.info(f'Instance {instance} | Parallel run finished.')
+
+            except Exception:
+                logging.exception(f'Instance {instance} | Parallel run failed.')
+
+
+if __name__ == '__main__':
+    """Main method for running the mdrp-sim instances in parallel"""
+
+    configure_logs()
+
+    parser = argparse.ArgumentParser(description='Run mdrp-sim instances in parallel')
+    parser.add_argument('--instances', type=int, nargs='*', default=settings.INSTANCES)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    run_instances(instance_ids=args.instances, n_workers=args.workers)
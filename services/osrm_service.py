@@ -1,19 +1,89 @@
 import logging
-from typing import Tuple, Dict, Any
+from functools import lru_cache
+from typing import Tuple, Dict, Any, List, Optional
 
+import numpy as np
 import requests
-from haversine import haversine
+from requests.adapters import HTTPAdapter
+from haversine import haversine_vector
 
 from objects.location import Location
 from objects.route import Route
 from objects.stop import Stop
+from policies.courier.movement._kernels import leg_distances
 from objects.vehicle import Vehicle
+from settings import settings
+
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+
+def _parse_json(response) -> Any:
+    """Decodes an OSRM response with orjson when available, falling back to the stdlib parser"""
+
+    if orjson is not None:
+        return orjson.loads(response.content)
+
+    return response.json()
+
+
+COORDINATE_PRECISION = 6  # Decimal places (~0.1 m) used to quantize coordinates for route caching
+
+# Shared session so successive OSRM requests reuse keep-alive sockets instead of
+# paying the TCP handshake on every call
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0))
 
 
 class OSRMService:
     """Class that contains the Open Source Routing Machine service to obtain city routes"""
 
     URL = 'http://127.0.0.1:5000/route/v1/driving/{lng_0},{lat_0};{lng_1},{lat_1}?alternatives=false&steps=true'
+    FAST_ROUTE_URL = (
+        'http://127.0.0.1:5000/route/v1/driving/{lng_0},{lat_0};{lng_1},{lat_1}'
+        '?alternatives=false&steps=false&overview=false'
+    )
+    TABLE_URL = (
+        'http://127.0.0.1:5000/table/v1/driving/{coordinates}'
+        '?sources={sources}&destinations={destinations}&annotations=duration,distance'
+    )
+
+    @classmethod
+    def get_table(
+            cls,
+            sources: List[Location],
+            destinations: List[Location]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Method to obtain the duration [s] and distance [m] matrices between many locations
+        using a single request to docker-mounted OSRM.
+        Returns None if the table service is unavailable, so callers can fall back to per-pair routing.
+        """
+
+        coordinates = ';'.join(f'{location.lng},{location.lat}' for location in sources + destinations)
+        url = cls.TABLE_URL.format(
+            coordinates=coordinates,
+            sources=';'.join(str(ix) for ix in range(len(sources))),
+            destinations=';'.join(str(ix + len(sources)) for ix in range(len(destinations)))
+        )
+
+        try:
+            response = _SESSION.get(url, timeout=5)
+
+            if response and response.status_code in [requests.codes.ok, requests.codes.no_content]:
+                response_data = _parse_json(response)
+                durations = np.asarray(response_data['durations'], dtype=np.float64)
+                distances = np.asarray(response_data['distances'], dtype=np.float64)
+
+                return durations, distances
+
+        except:
+            logging.exception('Exception captured in OSRMService.get_table. Check Docker.')
+
+        return None
 
     @classmethod
     def get_route(cls, origin: Location, destination: Location) -> Route:
@@ -25,11 +95,12 @@ class OSRMService:
         url = cls.URL.format(lng_0=lng_0, lat_0=lat_0, lng_1=lng_1, lat_1=lat_1)
 
         try:
-            response = requests.get(url, timeout=5)
+            response = _SESSION.get(url, timeout=5)
 
             if response and response.status_code in [requests.codes.ok, requests.codes.no_content]:
-                response_data = response.json()
-                steps = response_data.get('routes', [])[0].get('legs', [])[0].get('steps', [])
+                response_data = _parse_json(response)
+                osrm_route = response_data.get('routes', [])[0]
+                steps = osrm_route.get('legs', [])[0].get('steps', [])
 
                 stops = []
                 for ix, step in enumerate(steps):
@@ -40,7 +111,11 @@ class OSRMService:
                     )
                     stops.append(stop)
 
-                return Route(stops=stops)
+                return Route(
+                    stops=stops,
+                    road_distance=osrm_route.get('distance'),
+                    road_duration=osrm_route.get('duration')
+                )
 
         except:
             logging.exception('Exception captured in OSRMService.get_route. Check Docker.')
@@ -58,6 +133,43 @@ class OSRMService:
                 ]
             )
 
+    @classmethod
+    def get_route_metrics(cls, origin: Location, destination: Location) -> Optional[Tuple[float, float]]:
+        """
+        Method to obtain only the road distance [m] and duration [s] between two locations.
+        Skipping the turn-by-turn geometry keeps both the OSRM work and the JSON payload minimal.
+        Returns None if the routing service is unavailable.
+        """
+
+        lat_0, lng_0 = origin.coordinates
+        lat_1, lng_1 = destination.coordinates
+
+        url = cls.FAST_ROUTE_URL.format(lng_0=lng_0, lat_0=lat_0, lng_1=lng_1, lat_1=lat_1)
+
+        try:
+            response = _SESSION.get(url, timeout=5)
+
+            if response and response.status_code in [requests.codes.ok, requests.codes.no_content]:
+                route = _parse_json(response)['routes'][0]
+
+                return route['distance'], route['duration']
+
+        except:
+            logging.exception('Exception captured in OSRMService.get_route_metrics. Check Docker.')
+
+        return None
+
+    @classmethod
+    def get_cached_route(cls, origin: Location, destination: Location) -> Route:
+        """Method to obtain a movement route, memoizing repeated origin / destination pairs"""
+
+        return _cached_route(
+            round(origin.lat, COORDINATE_PRECISION),
+            round(origin.lng, COORDINATE_PRECISION),
+            round(destination.lat, COORDINATE_PRECISION),
+            round(destination.lng, COORDINATE_PRECISION)
+        )
+
     @classmethod
     def estimate_route_properties(cls, origin: Location, route: Route, vehicle: Vehicle) -> Tuple[float, float]:
         """Method to estimate the distance and time it would take to fulfill a route from an origin"""
@@ -97,37 +209,13 @@ class OSRMService:
     ) -> Tuple[float, float]:
         """Method to estimate the distance and time it takes to go from an origin to a destination"""
 
-        route_distance, route_time = 0, 0
-
-        try:
-            travelling_route = cls.get_route(origin=origin, destination=destination)
-
-        except:
-            logging.exception('Exception captured in OSRMService.estimate_travelling_properties. Check Docker.')
-            travelling_route = Route(
-                stops=[
-                    Stop(
-                        location=origin,
-                        position=0
-                    ),
-                    Stop(
-                        location=destination,
-                        position=1
-                    )
-                ]
-            )
-
-        for travelling_ix in range(len(travelling_route.stops) - 1):
-            distance = haversine(
-                point1=travelling_route.stops[travelling_ix].location.coordinates,
-                point2=travelling_route.stops[travelling_ix + 1].location.coordinates
-            )
-            time = int(distance / vehicle.average_velocity)
-
-            route_distance += distance
-            route_time += time
-
-        return route_distance, route_time
+        return _cached_travel_metrics(
+            round(origin.lat, COORDINATE_PRECISION),
+            round(origin.lng, COORDINATE_PRECISION),
+            round(destination.lat, COORDINATE_PRECISION),
+            round(destination.lng, COORDINATE_PRECISION),
+            vehicle.average_velocity
+        )
 
     @classmethod
     def update_estimate_time_for_vehicles(
@@ -151,3 +239,82 @@ class OSRMService:
                 time_estimation = 0
 
             time[v] += time_estimation + service_time
+
+
+@lru_cache(maxsize=settings.OSRM_CACHE_SIZE)
+def _cached_route(lat_0: float, lng_0: float, lat_1: float, lng_1: float) -> Route:
+    """Memoized route lookup keyed by quantized coordinates"""
+
+    return OSRMService.get_route(
+        origin=Location(lat=lat_0, lng=lng_0),
+        destination=Location(lat=lat_1, lng=lng_1)
+    )
+
+
+@lru_cache(maxsize=settings.OSRM_CACHE_SIZE)
+def _cached_travel_metrics(
+        lat_0: float,
+        lng_0: float,
+        lat_1: float,
+        lng_1: float,
+        average_velocity: float
+) -> Tuple[float, float]:
+    """
+    Memoized distance and time estimation keyed by quantized coordinates and vehicle velocity,
+    so repeated legs (couriers cluster geographically and routes share stops) skip the
+    route lookup and the per-leg arithmetic entirely.
+    """
+
+    origin = Location(lat=lat_0, lng=lng_0)
+    destination = Location(lat=lat_1, lng=lng_1)
+
+    # The estimates stay per-vehicle by dividing the road distance by the vehicle velocity,
+    # so only the distance of the metrics response is consumed
+    metrics = OSRMService.get_route_metrics(origin=origin, destination=destination)
+    if metrics is not None:
+        route_distance = metrics[0] / 1000
+
+        return route_distance, int(route_distance / average_velocity)
+
+    try:
+        travelling_route = OSRMService.get_route(origin=origin, destination=destination)
+
+    except:
+        logging.exception('Exception captured in OSRMService.estimate_travelling_properties. Check Docker.')
+        travelling_route = Route(
+            stops=[
+                Stop(
+                    location=origin,
+                    position=0
+                ),
+                Stop(
+                    location=destination,
+                    position=1
+                )
+            ]
+        )
+
+    # When OSRM answered, its road distance is exact; summing haversine segments between
+    # the maneuver points would only recompute a worse approximation of the same number
+    if travelling_route.road_distance is not None:
+        route_distance = travelling_route.road_distance / 1000
+
+        return route_distance, int(route_distance / average_velocity)
+
+    stops = travelling_route.stops
+    if len(stops) < 2:
+        return 0, 0
+
+    if leg_distances is not None:
+        lats = np.fromiter((stop.location.lat for stop in stops), dtype=np.float64, count=len(stops))
+        lngs = np.fromiter((stop.location.lng for stop in stops), dtype=np.float64, count=len(stops))
+        distances = leg_distances(lats, lngs)
+
+    else:
+        coordinates = np.array([stop.location.coordinates for stop in stops])
+        distances = haversine_vector(coordinates[:-1], coordinates[1:])
+
+    route_distance = float(distances.sum())
+    route_time = int((distances / average_velocity).astype(np.int64).sum())
+
+    return route_distance, route_time
@@ -52,6 +52,10 @@ settings = Settings({
     'INSTANCES': [301],
     # --- bool =  Enable / Disable specific (verbose) actor and policy logs
     'VERBOSE_LOGS': False,
+    # --- bool =  Enable / Disable the spoken (macOS say) notification when an instance finishes
+    'NOTIFY_ON_COMPLETE': False,
+    # --- int = Maximum number of entries kept in the OSRM route / travel metric caches
+    'OSRM_CACHE_SIZE': 100_000,
     # --- Optional[Union[float, int]] = Seed for running the simulation. Can be None.
     'SEED': 8795,
     # str = Optimizer to use. Options: ['pulp', 'gurobi']
@@ -84,6 +88,8 @@ settings = Settings({
     'DISPATCHER_PREPOSITIONING_POLICY': 'naive',
     # --- str = Policy for matching. Options: ['greedy', 'mdrp', 'mdrp_graph', 'mdrp_graph_prospects', 'modified_mdrp']
     'DISPATCHER_MATCHING_POLICY': 'mdrp',
+    # --- str = Assignment solver used by the greedy matching policy. Options: ['greedy', 'hungarian', 'auction']
+    'DISPATCHER_MATCHING_SOLVER': 'greedy',
     # --- str = Policy for demand management. Options: ['no_demand_management', 'yes_demand_management']
     'DISPATCHER_DEMAND_MANAGEMENT_POLICY': 'yes_demand_management',
     
@@ -1,12 +1,11 @@
 import random
 
-from simpy import Environment
-
 from settings import settings
 from actors.world import World
 from services.metrics_service import MetricsService
 from utils.datetime_utils import time_to_sec
 from utils.logging_utils import configure_logs
+from utils.simpy_utils import TunedEnvironment
 
 if __name__ == '__main__':
     """Main method for running the mdrp-sim"""
@@ -16,7 +15,7 @@ if __name__ == '__main__':
     for instance in settings.INSTANCES:
         random.seed(settings.SEED)
 
-        env = Environment(initial_time=time_to_sec(settings.SIMULATE_FROM))
+        env = TunedEnvironment(initial_time=time_to_sec(settings.SIMULATE_FROM))
         world = World(env=env, instance=instance)
         env.run(until=time_to_sec(settings.SIMULATE_UNTIL))
         world.post_process()
@@ -0,0 +1,143 @@
+import unittest
+from datetime import time
+from unittest.mock import patch
+
+import numpy as np
+
+from actors.courier import Courier
+from objects.location import Location
+from objects.order import Order
+from objects.vehicle import Vehicle
+from policies.dispatcher.matching._kernels import auction_assign
+from policies.dispatcher.matching.greedy import AUCTION_EPSILON, INFEASIBLE_COST, GreedyMatchingPolicy
+from tests.test_utils import mocked_get_route
+
+try:
+    from scipy.optimize import linear_sum_assignment
+
+except ImportError:
+    linear_sum_assignment = None
+
+
+def random_cost_matrix(rng: np.random.Generator) -> np.ndarray:
+    """Builds a random cost matrix where roughly 60% of the pairs are prospects"""
+
+    num_orders = int(rng.integers(1, 16))
+    num_couriers = int(rng.integers(1, 16))
+    cost = np.full((num_orders, num_couriers), INFEASIBLE_COST)
+    mask = rng.random((num_orders, num_couriers)) < 0.6
+    cost[mask] = rng.uniform(10, 3000, size=int(mask.sum()))
+
+    return cost
+
+
+class TestsMatchingSolvers(unittest.TestCase):
+    """Tests for the assignment solvers behind the greedy matching policy"""
+
+    def test_auction_validity(self):
+        """Test that the auction solver always returns a valid assignment"""
+
+        rng = np.random.default_rng(8795)
+
+        for _ in range(50):
+            cost = random_cost_matrix(rng)
+            assigned = auction_assign(cost, AUCTION_EPSILON, INFEASIBLE_COST)
+
+            # Assert each order maps to at most one courier and no courier is matched twice
+            self.assertEqual(len(assigned), cost.shape[0])
+            matched_couriers = [int(courier_ix) for courier_ix in assigned if courier_ix != -1]
+            self.assertEqual(len(matched_couriers), len(set(matched_couriers)))
+
+            # Assert no matched pair carries the infeasible cost
+            for order_ix, courier_ix in enumerate(assigned):
+                if courier_ix != -1:
+                    self.assertLess(cost[order_ix, courier_ix], INFEASIBLE_COST)
+
+    @unittest.skipIf(linear_sum_assignment is None, 'scipy is not installed')
+    def test_auction_parity_with_hungarian(self):
+        """Test that the auction matches the Hungarian cardinality and lands within its eps bound"""
+
+        rng = np.random.default_rng(8795)
+
+        for _ in range(50):
+            cost = random_cost_matrix(rng)
+
+            order_ixs, courier_ixs = linear_sum_assignment(cost)
+            hungarian_pairs = [
+                (order_ix, courier_ix)
+                for order_ix, courier_ix in zip(order_ixs, courier_ixs)
+                if cost[order_ix, courier_ix] < INFEASIBLE_COST
+            ]
+            hungarian_cost = sum(cost[order_ix, courier_ix] for order_ix, courier_ix in hungarian_pairs)
+
+            assigned = auction_assign(cost, AUCTION_EPSILON, INFEASIBLE_COST)
+            auction_pairs = [
+                (order_ix, int(courier_ix))
+                for order_ix, courier_ix in enumerate(assigned)
+                if courier_ix != -1
+            ]
+            auction_cost = sum(cost[order_ix, courier_ix] for order_ix, courier_ix in auction_pairs)
+
+            # Assert the auction never drops a match the Hungarian solver finds
+            self.assertEqual(len(auction_pairs), len(hungarian_pairs))
+
+            # Assert the total cost stays within the theoretical num_bidders * eps of the optimum
+            num_bidders = min(cost.shape)
+            feasible = cost[cost < INFEASIBLE_COST]
+            max_cost = float(feasible.max()) if feasible.size > 0 else 0.
+            eps = max(max_cost / (10. * (num_bidders + 1)), AUCTION_EPSILON)
+            self.assertLessEqual(auction_cost, hungarian_cost + num_bidders * eps + 1e-6)
+
+    @patch('settings.settings.DISPATCHER_PROSPECTS_MAX_DISTANCE', 8)
+    @patch('services.osrm_service.OSRMService.get_route', side_effect=mocked_get_route)
+    def test_execute_solver_paths(self, osrm):
+        """Test that every configured solver resolves the same simple instance identically"""
+
+        # Constants
+        on_time = time(7, 0, 0)
+        off_time = time(9, 0, 0)
+
+        # Services
+        policy = GreedyMatchingPolicy()
+
+        # Two orders and two couriers, each courier standing at the pick up of its order
+        order_1 = Order(
+            pick_up_at=Location(4.678622, -74.055694),
+            drop_off_at=Location(4.690207, -74.044235),
+            order_id=1
+        )
+        order_2 = Order(
+            pick_up_at=Location(4.690207, -74.044235),
+            drop_off_at=Location(4.678622, -74.055694),
+            order_id=2
+        )
+        courier_1 = Courier(
+            location=Location(4.678622, -74.055694),
+            on_time=on_time,
+            off_time=off_time,
+            vehicle=Vehicle.CAR,
+            condition='idle',
+            courier_id=1
+        )
+        courier_2 = Courier(
+            location=Location(4.690207, -74.044235),
+            on_time=on_time,
+            off_time=off_time,
+            vehicle=Vehicle.CAR,
+            condition='idle',
+            courier_id=2
+        )
+
+        for solver in ['greedy', 'hungarian', 'auction']:
+            with patch('settings.settings.DISPATCHER_MATCHING_SOLVER', solver):
+                notifications, _ = policy.execute(
+                    orders=[order_1, order_2],
+                    couriers=[courier_1, courier_2],
+                    env_time=4
+                )
+
+            self.assertEqual(len(notifications), 2)
+            self.assertEqual(notifications[0].courier, courier_1)
+            self.assertIn(order_1, notifications[0].instruction.orders.values())
+            self.assertEqual(notifications[1].courier, courier_2)
+            self.assertIn(order_2, notifications[1].instruction.orders.values())
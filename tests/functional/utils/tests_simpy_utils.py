@@ -0,0 +1,110 @@
+import unittest
+from typing import List, Tuple, Type
+
+from simpy import Environment, Interrupt
+
+from utils.simpy_utils import TunedEnvironment
+
+
+class TestsTunedEnvironment(unittest.TestCase):
+    """Tests asserting the tuned environment reproduces the stock simpy run loop exactly"""
+
+    ENVIRONMENT_CLASSES = [Environment, TunedEnvironment]
+
+    @staticmethod
+    def _run_interleaved(environment_class: Type[Environment]) -> Tuple[List, float]:
+        """Runs two interleaved periodic processes plus an event scheduled exactly at the horizon"""
+
+        env = environment_class()
+        trace = []
+
+        def worker(name: str, delay: int, repetitions: int):
+            for _ in range(repetitions):
+                yield env.timeout(delay)
+                trace.append((env.now, name))
+
+        env.process(worker('fast', 2, 12))
+        env.process(worker('slow', 3, 8))
+        env.run(until=20)
+
+        return trace, env.now
+
+    @staticmethod
+    def _run_interrupted(environment_class: Type[Environment]) -> Tuple[List, float]:
+        """Runs a process that gets interrupted mid-wait and then resumes"""
+
+        env = environment_class()
+        trace = []
+
+        def victim():
+            try:
+                yield env.timeout(10)
+                trace.append((env.now, 'finished'))
+
+            except Interrupt as interrupt:
+                trace.append((env.now, 'interrupted', str(interrupt.cause)))
+                yield env.timeout(2)
+                trace.append((env.now, 'resumed'))
+
+        def interrupter(process):
+            yield env.timeout(4)
+            process.interrupt('stop')
+
+        process = env.process(victim())
+        env.process(interrupter(process))
+        env.run(until=20)
+
+        return trace, env.now
+
+    def test_event_order_matches_simpy(self):
+        """Test that both environments process the same events, in the same order"""
+
+        simpy_trace, simpy_now = self._run_interleaved(Environment)
+        tuned_trace, tuned_now = self._run_interleaved(TunedEnvironment)
+
+        self.assertEqual(tuned_trace, simpy_trace)
+        self.assertEqual(tuned_now, simpy_now)
+        self.assertEqual(tuned_now, 20)
+
+        # Assert events scheduled exactly at the horizon are excluded, as in stock simpy
+        self.assertNotIn((20, 'fast'), tuned_trace)
+        self.assertTrue(all(timestamp < 20 for timestamp, _ in tuned_trace))
+
+    def test_interrupt_behavior_matches_simpy(self):
+        """Test that interrupts propagate with the same cause and timing"""
+
+        simpy_trace, simpy_now = self._run_interrupted(Environment)
+        tuned_trace, tuned_now = self._run_interrupted(TunedEnvironment)
+
+        self.assertEqual(tuned_trace, simpy_trace)
+        self.assertEqual(tuned_now, simpy_now)
+        self.assertEqual(tuned_trace[0], (4, 'interrupted', 'stop'))
+
+    def test_exception_propagation_matches_simpy(self):
+        """Test that an uncaught process exception surfaces from run in both environments"""
+
+        outcomes = []
+        for environment_class in self.ENVIRONMENT_CLASSES:
+            env = environment_class()
+
+            def failing():
+                yield env.timeout(5)
+                raise RuntimeError('boom')
+
+            env.process(failing())
+            with self.assertRaises(RuntimeError) as context:
+                env.run(until=20)
+
+            outcomes.append((str(context.exception), env.now))
+
+        self.assertEqual(outcomes[0], outcomes[1])
+
+    def test_until_in_the_past_raises(self):
+        """Test that running until a non-future time raises a ValueError in both environments"""
+
+        for environment_class in self.ENVIRONMENT_CLASSES:
+            env = environment_class()
+            env.run(until=10)
+
+            with self.assertRaises(ValueError):
+                env.run(until=10)
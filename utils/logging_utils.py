@@ -24,8 +24,8 @@ def configure_logs():
 def log(env: Environment, actor_name: str, condition: str, msg: str):
     """Method to handle how an info log is shown"""
 
-    if settings.VERBOSE_LOGS:
-        logging.info(f'sim time = {sec_to_time(env.now)} | actor = {actor_name} (condition = {condition}) | {msg}')
+    if settings.VERBOSE_LOGS and logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info('sim time = %s | actor = %s (condition = %s) | %s', sec_to_time(env.now), actor_name, condition, msg)
 
 
 def world_log(dispatcher) -> str:
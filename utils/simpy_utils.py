@@ -0,0 +1,44 @@
+from heapq import heappop
+from typing import Optional, Union, Any
+
+from simpy import Environment
+from simpy.core import SimTime
+from simpy.events import Event
+
+
+class TunedEnvironment(Environment):
+    """
+    Environment whose run loop is inlined for large event populations.
+    SimPy already schedules events on a C-backed heapq of plain tuples, so the remaining per-event cost
+    is pure Python dispatch: one step() call, one try/except and several attribute lookups per event.
+    This subclass collapses the loop for the common run(until=<number>) case, hoisting the queue and
+    heappop into locals while keeping the exact step() semantics.
+    """
+
+    def run(self, until: Optional[Union[SimTime, Event]] = None) -> Optional[Any]:
+        """Executes events until the given criterion is met, inlining the hot loop for numeric criteria"""
+
+        if until is None or isinstance(until, Event):
+            return super().run(until=until)
+
+        queue = self._queue
+        stop_at = until if isinstance(until, int) else float(until)
+
+        if stop_at <= self._now:
+            raise ValueError(f'until ({stop_at}) must be greater than the current simulation time')
+
+        while queue and queue[0][0] < stop_at:
+            self._now, _, _, event = heappop(queue)
+
+            callbacks, event.callbacks = event.callbacks, None
+            for callback in callbacks:
+                callback(event)
+
+            if not event._ok and not hasattr(event, '_defused'):
+                exc = type(event._value)(*event._value.args)
+                exc.__cause__ = event._value
+                raise exc
+
+        self._now = stop_at
+
+        return None